@@ -0,0 +1,44 @@
+"""Helpers shared by the benchmark scripts."""
+
+import glob
+import importlib.util
+import json
+import os
+import sys
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+DAG_PATH = os.environ.get(
+    "TECH_NEWS_DAG_PATH",
+    os.path.join(BENCHMARKS_DIR, "..", "dags", "tech_news_publisher.py"),
+)
+if not os.path.exists(DAG_PATH):
+    # Inside the Airflow containers the DAG folder is mounted at /opt/airflow/dags
+    DAG_PATH = "/opt/airflow/dags/tech_news_publisher.py"
+
+DEFAULT_ARTICLES_ARCHIVE = "/opt/airflow/logs/archive/articles"
+
+
+def load_dag_module():
+    """Import the DAG file as a regular module so its module-level helpers can be benchmarked."""
+    spec = importlib.util.spec_from_file_location("tech_news_publisher", DAG_PATH)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_saved_articles(location: str = DEFAULT_ARTICLES_ARCHIVE) -> list:
+    """Every archived article: from the Parquet archive directory, or from a glob of legacy articles_*.json files."""
+    if os.path.isdir(location):
+        import pyarrow.dataset as ds
+
+        return ds.dataset(location, format="parquet", partitioning="hive").to_table().to_pylist()
+
+    articles = []
+    for path in sorted(glob.glob(location)):
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        for source, items in data.get("articles", {}).items():
+            for article in items:
+                articles.append(dict(article, source=article.get("source") or source))
+    return articles
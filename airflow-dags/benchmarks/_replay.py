@@ -0,0 +1,189 @@
+"""Record/replay fixtures for the extraction benchmarks: captured feeds and pages plus a local HTTP stand-in."""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+DEFAULT_FIXTURES_DIR = "/opt/airflow/logs/replay_fixtures"
+
+
+class FixtureStore:
+    """Response bodies on disk plus an index.json of url -> status, headers and kind ("feed" or "page")."""
+
+    def __init__(self, root: str = DEFAULT_FIXTURES_DIR):
+        self.root = root
+        self.index_path = os.path.join(root, "index.json")
+        self.index = {}
+        if os.path.exists(self.index_path):
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                self.index = json.load(f)
+
+    def __contains__(self, url: str) -> bool:
+        return url in self.index
+
+    def urls(self, kind: str = None) -> list:
+        return [url for url, entry in self.index.items() if kind is None or entry["kind"] == kind]
+
+    def put(self, url: str, kind: str, status: int, headers: dict, body: bytes, **extra) -> None:
+        os.makedirs(os.path.join(self.root, "bodies"), exist_ok=True)
+        name = hashlib.sha1(url.encode()).hexdigest()[:16]
+        with open(os.path.join(self.root, "bodies", name), "wb") as f:
+            f.write(body)
+        self.index[url] = {
+            "kind": kind,
+            "file": name,
+            "status": status,
+            "content_type": headers.get("Content-Type", "application/octet-stream"),
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+            "recorded_at": time.time(),
+            **extra,
+        }
+
+    def get(self, url: str) -> tuple:
+        """(index entry, body) for a recorded URL, or (None, None)."""
+        entry = self.index.get(url)
+        if entry is None:
+            return None, None
+        with open(os.path.join(self.root, "bodies", entry["file"]), "rb") as f:
+            return entry, f.read()
+
+    def save(self) -> None:
+        os.makedirs(self.root, exist_ok=True)
+        with open(f"{self.index_path}.tmp", "w", encoding="utf-8") as f:
+            json.dump(self.index, f, ensure_ascii=False, indent=2)
+        os.replace(f"{self.index_path}.tmp", self.index_path)
+
+
+def record_sources(store: FixtureStore, sources: list, headers: dict, max_entries: int = 20) -> int:
+    """Capture each RSS source's feed and the pages it links to; returns the number of new responses."""
+    import feedparser
+    import requests
+
+    session = requests.Session()
+    session.headers.update(headers)
+    recorded = 0
+
+    def capture(url: str, kind: str, **extra) -> bytes:
+        nonlocal recorded
+        if url in store:
+            return store.get(url)[1]
+        try:
+            response = session.get(url, timeout=30)
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            print(f"⚠️  {url}: {e}")
+            return None
+        store.put(url, kind, response.status_code, response.headers, response.content, **extra)
+        recorded += 1
+        return response.content
+
+    for source in sources:
+        if source.get("kind") != "rss":
+            print(f"⏭  {source['name']}: only RSS sources can be recorded over plain HTTP")
+            continue
+        body = capture(source["feed_url"], "feed", source=source["name"])
+        if body is None:
+            continue
+        for entry in feedparser.parse(body).entries[:source.get("max_entries", max_entries)]:
+            link = getattr(entry, "link", "")
+            if link:
+                capture(link, "page", source=source["name"])
+    store.save()
+    return recorded
+
+
+class ReplayServer:
+    """Serves recorded responses over local HTTP.
+
+    https://example.com/a?b=1 is served at <base_url>/https/example.com/a?b=1 (see local_url).
+    Conditional requests get 304s from the recorded validators, unrecorded URLs 404s, and
+    ``latency`` adds a fixed delay per response to model network time.
+    """
+
+    def __init__(self, store: FixtureStore, latency: float = 0.0):
+        self.store = store
+        self.latency = latency
+        self.requests = 0
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.server.daemon_threads = True
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.thread = threading.Thread(target=self.server.serve_forever, name="replay-server", daemon=True)
+
+    def local_url(self, url: str) -> str:
+        parts = urlsplit(url)
+        return f"{self.base_url}/{parts.scheme}/{parts.netloc}{parts.path or '/'}" + (f"?{parts.query}" if parts.query else "")
+
+    def original_url(self, path: str) -> str:
+        scheme, _, rest = path.lstrip("/").partition("/")
+        return f"{scheme}://{rest}"
+
+    def _handler(self):
+        replay = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                replay.requests += 1
+                if replay.latency:
+                    time.sleep(replay.latency)
+                entry, body = replay.store.get(replay.original_url(self.path))
+                if entry is None:
+                    self.send_response(404)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                if ((entry["etag"] and self.headers.get("If-None-Match") == entry["etag"])
+                        or (entry["last_modified"] and self.headers.get("If-Modified-Since") == entry["last_modified"])):
+                    self.send_response(304)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                self.send_response(entry["status"])
+                self.send_header("Content-Type", entry["content_type"])
+                self.send_header("Content-Length", str(len(body)))
+                for header, key in (("ETag", "etag"), ("Last-Modified", "last_modified")):
+                    if entry[key]:
+                        self.send_header(header, entry[key])
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def __enter__(self) -> "ReplayServer":
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class ReplayTransport:
+    """Wraps the DAG's HttpTransport so every request goes to a ReplayServer instead of the network.
+
+    Pass it as ``transport=`` to AdvancedContentExtractor and FeedPoller: URLs, and with them
+    domains, strategy stats, breakers and rate limits, stay the original ones while the bytes
+    come from the fixtures over the real client and its connection pools.
+    """
+
+    def __init__(self, server: ReplayServer, transport):
+        self.server = server
+        self.transport = transport
+
+    def get(self, url: str, headers: dict = None, timeout: float = 30):
+        return self.transport.get(self.server.local_url(url), headers=headers, timeout=timeout)
+
+    def describe(self) -> str:
+        return f"{self.transport.describe()}, replayed from {self.server.base_url}"
+
+    def close(self) -> None:
+        self.transport.close()
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Benchmark - boilerplate cleaning
+Compares clean_extracted_text / clean_article_text from the DAG with the original
+per-pattern re.sub implementations on the saved article corpus, checking the output
+is identical and reporting throughput.
+
+Run inside the Airflow image, e.g.:
+    docker compose run --rm airflow-cli python /opt/airflow/benchmarks/bench_cleaning.py
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+
+from _dag_module import DEFAULT_ARTICLES_ARCHIVE, load_dag_module, load_saved_articles
+
+# Boilerplate sprinkled into the corpus so every rule has something to remove
+BOILERPLATE = [
+    "Subscribe to our weekly newsletter",
+    "Follow us on all our social media",
+    "Share this article",
+    "Read more articles:",
+    "Continue reading",
+    "Sign up for daily updates",
+    "Get the latest tech news",
+    "Advertisement",
+    "Sponsored content",
+    "12 comments",
+    "Comments (3)",
+    "We're launching a new TC Sessions event in Boston.",
+    "Image Credits: Getty Images.",
+    "Image: Someone / Gizmodo",
+    "If you buy something through a link in this article, we may earn commission.",
+    "Follow us on Twitter.",
+    "<div class=\"ad\">",
+    "</p>",
+]
+
+
+def legacy_clean_content(text: str, source: str) -> str:
+    """AdvancedContentExtractor.clean_content before the precompiled rules."""
+    if not text:
+        return ""
+    
+    # Remove common boilerplate patterns
+    patterns_to_remove = [
+        r"Subscribe to.*?newsletter",
+        r"Follow us on.*?social media",
+        r"Share this article",
+        r"Read more(?:\s+articles)?:?",
+        r"Continue reading",
+        r"Sign up for.*?updates",
+        r"Get the latest.*?news",
+        r"This article originally appeared on.*?\.com",
+        r"Image credit:.*",
+        r"Photo credit:.*",
+        r"Source:.*",
+        r"Related:.*",
+        r"See also:.*",
+        r"Advertisement",
+        r"ADVERTISEMENT",
+        r"Sponsored content",
+        r"\d+ comments?",
+        r"Comments? \(\d+\)",
+    ]
+    
+    for pattern in patterns_to_remove:
+        text = re.sub(pattern, "", text, flags=re.IGNORECASE | re.DOTALL)
+    
+    # Site-specific cleanup
+    if "TechCrunch" in source:
+        text = re.sub(r"We're launching.*?TC Sessions.*?\.(?:\s|$)", "", text, flags=re.IGNORECASE)
+        text = re.sub(r"Image Credits?:.*?(?:\.|$)", "", text, flags=re.IGNORECASE)
+    elif "Engadget" in source:
+        text = re.sub(r"This article originally appeared on Engadget.*", "", text, flags=re.DOTALL)
+        text = re.sub(r"Image credit:.*?Engadget", "", text, flags=re.IGNORECASE)
+    elif "Gizmodo" in source:
+        text = re.sub(r"Image:.*?Gizmodo", "", text, flags=re.IGNORECASE)
+        text = re.sub(r"Read more:.*", "", text, flags=re.DOTALL)
+    elif "The Information" in source:
+        text = re.sub(r"This story is available exclusively to.*", "", text, flags=re.IGNORECASE)
+        text = re.sub(r"Subscribe to.*?The Information.*", "", text, flags=re.IGNORECASE)
+    
+    # Normalize whitespace
+    text = re.sub(r'\s+', ' ', text.strip())
+    text = re.sub(r'\n\s*\n', '\n\n', text)
+    
+    return text.strip()
+
+
+def legacy_parse_content(content: str) -> str:
+    """The content cleaning in parse_article_content before the precompiled rules."""
+    content = re.sub(r'This article originally appeared on.*?\.', '', content, flags=re.IGNORECASE)
+    content = re.sub(r'About our ads.*$', '', content, flags=re.IGNORECASE | re.DOTALL)
+    content = re.sub(r'\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s*$', '', content)
+    content = re.sub(r'<[^>]+>', '', content)
+    content = re.sub(r'\s+', ' ', content)
+    content = content.strip()
+    
+    unwanted_phrases = [
+        "Subscribe to our newsletter",
+        "Sign up for our newsletter", 
+        "Follow us on",
+        "If you buy something through a link in this article, we may earn commission",
+        "Why you can trust us Engadget has been testing and reviewing consumer tech since 2004",
+        "Our stories may include affiliate links; if you buy something through a link, we may earn a commission",
+        "about how we evaluate products"
+    ]
+    
+    for phrase in unwanted_phrases:
+        content = re.sub(re.escape(phrase) + r'.*?\.', '', content, flags=re.IGNORECASE)
+    
+    return content
+
+
+def inject_boilerplate(text: str, rng: random.Random) -> str:
+    sentences = re.split(r'(?<=[.!?])\s+', text)
+    for _ in range(max(1, len(sentences) // 8)):
+        sentences.insert(rng.randrange(len(sentences) + 1), rng.choice(BOILERPLATE))
+    return " ".join(sentences)
+
+
+def bench(name: str, fn, inputs: list, repeat: int) -> tuple:
+    outputs = [fn(*args) for args in inputs]
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for args in inputs:
+            fn(*args)
+    elapsed = (time.perf_counter() - started) / repeat
+    return outputs, elapsed
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark boilerplate cleaning against the legacy regex passes")
+    parser.add_argument("--corpus", default=DEFAULT_ARTICLES_ARCHIVE, help="Article archive directory (or a glob of legacy articles_*.json files)")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed passes over the corpus")
+    parser.add_argument("--seed", type=int, default=42, help="Seed for boilerplate injection")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    articles = [a for a in load_saved_articles(args.corpus) if a.get("content")]
+    if not articles:
+        print(f"❌ No saved articles found for {args.corpus}")
+        return 1
+
+    dag_module = load_dag_module()
+    rng = random.Random(args.seed)
+    corpora = {
+        "saved": [(a["content"], a["source"]) for a in articles],
+        "saved+boilerplate": [(inject_boilerplate(a["content"], rng), a["source"]) for a in articles],
+    }
+
+    print(f"📊 {len(articles)} articles, {sum(len(a['content']) for a in articles):,} chars")
+    failures = 0
+    for corpus_name, inputs in corpora.items():
+        cases = [
+            ("clean_content", legacy_clean_content, dag_module.clean_extracted_text, inputs),
+            ("parse_article_content", legacy_parse_content, dag_module.clean_article_text,
+             [(text,) for text, _ in inputs]),
+        ]
+        for label, legacy_fn, new_fn, case_inputs in cases:
+            legacy_out, legacy_s = bench(label, legacy_fn, case_inputs, args.repeat)
+            new_out, new_s = bench(label, new_fn, case_inputs, args.repeat)
+            mismatches = sum(1 for a, b in zip(legacy_out, new_out) if a != b)
+            failures += mismatches
+            print(f"{corpus_name:>18} | {label:<22} | legacy {legacy_s * 1000:8.1f} ms | "
+                  f"new {new_s * 1000:8.1f} ms | {legacy_s / new_s if new_s else float('inf'):5.1f}x | "
+                  f"{len(case_inputs) / new_s if new_s else float('inf'):9.0f} articles/s | mismatches {mismatches}")
+
+    if failures:
+        print(f"❌ {failures} outputs differ from the legacy implementation")
+        return 1
+    print("✅ Output identical to the legacy implementation")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
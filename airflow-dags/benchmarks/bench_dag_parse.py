@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark - DAG parse time
+Imports the DAG file the way the DAG processor does, in fresh interpreters that have
+already loaded Airflow and pendulum, and checks that parsing stays within budget and
+does not pull in any of the scraping, browser, storage or LLM libraries.
+
+Run inside the Airflow image, e.g.:
+    docker compose run --rm airflow-cli python /opt/airflow/benchmarks/bench_dag_parse.py
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+from _dag_module import DAG_PATH
+
+# Only task execution may load these
+HEAVY_MODULES = [
+    "requests", "bs4", "lxml", "feedparser", "trafilatura", "newspaper", "readability", "selenium",
+    "openai", "httpx", "brotli", "zstandard", "boto3", "pyarrow",
+]
+
+PROBE = """
+import importlib.util, json, sys, time
+import pendulum
+import airflow.decorators, airflow.models.variable  # already loaded in a DAG processor
+before = set(sys.modules)
+started = time.perf_counter()
+spec = importlib.util.spec_from_file_location("tech_news_publisher", sys.argv[1])
+module = importlib.util.module_from_spec(spec)
+sys.modules[spec.name] = module
+spec.loader.exec_module(module)
+elapsed = time.perf_counter() - started
+loaded = sorted({name.split(".")[0] for name in set(sys.modules) - before})
+print(json.dumps({"ms": elapsed * 1000, "loaded": loaded}))
+"""
+
+
+def parse_once(dag_path: str) -> dict:
+    result = subprocess.run([sys.executable, "-c", PROBE, dag_path], capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark how long the DAG file takes to parse")
+    parser.add_argument("--dag", default=DAG_PATH, help="DAG file to parse")
+    parser.add_argument("--runs", type=int, default=7, help="Fresh interpreters to parse in")
+    parser.add_argument("--budget-ms", type=float, default=200.0, help="Maximum median parse time")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    runs = [parse_once(args.dag) for _ in range(max(1, args.runs))]
+    times = sorted(run["ms"] for run in runs)
+    median = statistics.median(times)
+    heavy = sorted({name for run in runs for name in run["loaded"] if name in HEAVY_MODULES})
+
+    print(f"📊 {len(runs)} parses of {args.dag}: median {median:.1f} ms, "
+          f"min {times[0]:.1f} ms, max {times[-1]:.1f} ms (budget {args.budget_ms:.0f} ms)")
+    print(f"   Modules loaded by the DAG file: {', '.join(runs[0]['loaded']) or 'none'}")
+
+    failed = False
+    if heavy:
+        print(f"❌ Parsing imports task-only libraries: {', '.join(heavy)}")
+        failed = True
+    if median > args.budget_ms:
+        print(f"❌ Median parse time {median:.1f} ms exceeds the {args.budget_ms:.0f} ms budget")
+        failed = True
+    if failed:
+        return 1
+    print("✅ DAG parses within budget without task-only libraries")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+Benchmark - extraction cascade, offline
+Replays recorded feeds and article pages from a local HTTP stand-in and runs the DAG's
+extraction over them:
+  * pipeline: the DAG's FeedPoller, AdvancedContentExtractor and ExtractionEngine, with the
+    stand-in injected as their transport. A cold pass downloads every page, a second pass
+    ages the response cache out so every page is revalidated with a conditional GET (a path
+    DAG batch tasks, whose extractors are short-lived, do not reach). Strategy
+    stats and circuit breakers are kept in a temporary state directory;
+  * per strategy: latency and success rate of every HTML strategy on every page;
+  * parity: extracted text length per page and strategy against a saved baseline;
+  * peak RSS of the benchmark and of its worker processes.
+
+Record fixtures once (needs the network), save a baseline, then rerun offline:
+    docker compose run --rm airflow-cli python /opt/airflow/benchmarks/bench_extraction.py --record --save-baseline
+    docker compose run --rm airflow-cli python /opt/airflow/benchmarks/bench_extraction.py
+
+benchmarks/fixtures is a small committed store of synthetic pages in the sources' markup, with
+a baseline made with the library versions pinned in .github/workflows/airflow-benchmarks.yml.
+CI replays it and fails on parity mismatches or a pipeline slower than --min-rate. Refresh the
+baseline with --fixtures benchmarks/fixtures --save-baseline when those versions change.
+"""
+
+import argparse
+import collections
+import json
+import logging
+import os
+import resource
+import statistics
+import sys
+import tempfile
+import time
+
+import requests
+
+from _dag_module import load_dag_module
+from _replay import DEFAULT_FIXTURES_DIR, FixtureStore, ReplayServer, ReplayTransport, record_sources
+
+# Token bucket rate that never makes a request wait
+UNLIMITED_HOST_RATE = 1e9
+
+
+def percentile(values: list, fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] if ordered else 0.0
+
+
+def source_strategies(dag_module, sources: dict, source: str) -> list:
+    """The HTML part of a source's cascade: AdvancedContentExtractor's strategies without Selenium."""
+    configured = (sources.get(source) or {}).get("strategies")
+    if configured:
+        return [name for name in dag_module.HTML_STRATEGIES if name in configured]
+    return [name for name in dag_module.HTML_STRATEGIES if name != "techcrunch"]
+
+
+def replay_feeds(dag_module, store: FixtureStore, sources: dict, transport, state_dir: str) -> dict:
+    """Poll every recorded feed with FeedPoller, then once more conditionally.
+
+    Returns source name -> articles for the recorded pages, shaped like discover_rss_articles' output.
+    """
+    poller = dag_module.FeedPoller(os.path.join(state_dir, "feed_state.sqlite"), transport)
+    articles = {}
+    try:
+        for url in store.urls("feed"):
+            source = store.index[url].get("source", "")
+            started = time.perf_counter()
+            result = poller.poll(url, (sources.get(source) or {}).get("max_entries", 20))
+            elapsed = time.perf_counter() - started
+            poller.commit(result)
+            again = poller.poll(url)
+            recorded = [entry for entry in result.entries if getattr(entry, "link", "") in store]
+            articles.setdefault(source, []).extend({
+                "title": getattr(entry, "title", ""),
+                "link": entry.link,
+                "summary": getattr(entry, "summary", ""),
+                "guid": getattr(entry, "id", ""),
+                "source": source,
+                "content": None,
+            } for entry in recorded)
+            print(f"  feed {url}: {len(result.entries)} entries ({len(recorded)} recorded) in {elapsed * 1000:.1f} ms, "
+                  f"re-poll {'not modified' if again.not_modified else f'status {again.status}'}")
+    finally:
+        poller.close()
+    return articles
+
+
+def run_pipeline(dag_module, articles: dict, sources: dict, transport, cpu_pool, state_dir: str,
+                 args: argparse.Namespace) -> list:
+    """Extract every source's articles with ExtractionEngine as extract_articles does, in a cold and a revalidated pass."""
+    rate_limiter = dag_module.HostRateLimiter(rate=args.host_rate or UNLIMITED_HOST_RATE, burst=args.workers)
+    stats = dag_module.StrategyStats(os.path.join(state_dir, "extraction_strategy_stats.json"))
+    breaker = dag_module.CircuitBreaker("benchmark", path=os.path.join(state_dir, "circuit_breakers.json"))
+    extractors = {
+        source: dag_module.AdvancedContentExtractor(
+            rate_limiter, transport, stats, cpu_pool, source_strategies(dag_module, sources, source)
+        )
+        for source in articles
+    }
+    passes = []
+    counted = collections.Counter()
+    for name in ("cold", "revalidated"):
+        deadline = dag_module.Deadline(args.budget) if args.budget else None
+        started = time.perf_counter()
+        for source, items in articles.items():
+            for article in items:
+                article["content"] = None
+                article.pop("extraction", None)
+            dag_module.ExtractionEngine(extractors[source], args.workers, use_index=False, breaker=breaker).run(
+                items, source, deadline
+            )
+        seconds = time.perf_counter() - started
+        outcomes = [article["extraction"] for items in articles.values() for article in items]
+        cache = collections.Counter()
+        for extractor in extractors.values():
+            cache.update({key: value for key, value in extractor.cache.stats().items()
+                          if key in ("hits", "misses", "revalidations")})
+            # Every entry is stale from here on, so the next pass sends If-None-Match / If-Modified-Since
+            extractor.cache.max_age = 0
+        passes.append({
+            "pass": name,
+            "articles_per_second": len(outcomes) / seconds,
+            "extracted": sum(1 for outcome in outcomes if outcome["strategy"]),
+            "skipped": dict(collections.Counter(outcome["skipped"] for outcome in outcomes if outcome.get("skipped"))),
+            "cache": {key: value - counted[key] for key, value in cache.items()},
+        })
+        counted = cache
+    return passes
+
+
+def run_strategies(dag_module, pages: list) -> tuple:
+    """Every applicable strategy on every page, in-process; returns (per-strategy timings, chars by url)."""
+    timings = {name: [] for name in dag_module.HTML_STRATEGIES}
+    chars = {}
+    for page in pages:
+        for name in page["strategies"]:
+            attempts, _, _ = dag_module.extract_page_text(page["url"], page["body"], page["encoding"], [name], page["source"])
+            _, length, seconds = attempts[0]
+            timings[name].append((seconds, length))
+            chars.setdefault(page["url"], {})[name] = length
+    return timings, chars
+
+
+def compare(baseline: dict, chars: dict, tolerance: float) -> list:
+    """(url, strategy, baseline chars, current chars) for every output length outside the tolerance."""
+    mismatches = []
+    for url, by_strategy in chars.items():
+        for name, length in by_strategy.items():
+            expected = baseline.get(url, {}).get(name)
+            if expected is None:
+                continue
+            if (expected == 0) != (length == 0) or abs(length - expected) > tolerance * max(expected, 1):
+                mismatches.append((url, name, expected, length))
+    return mismatches
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Offline benchmark of the extraction cascade on recorded pages")
+    parser.add_argument("--fixtures", default=DEFAULT_FIXTURES_DIR, help="Fixture store directory")
+    parser.add_argument("--record", action="store_true", help="Capture feeds and pages of the RSS sources first")
+    parser.add_argument("--max-entries", type=int, default=20, help="Entries per feed to record")
+    parser.add_argument("--workers", type=int, default=8, help="ExtractionEngine worker threads")
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1, help="Parsing processes (0 = in the threads)")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Simulated network latency per response")
+    parser.add_argument("--host-rate", type=float, default=0.0, help="Requests per second per host (0 = no limit)")
+    parser.add_argument("--budget", type=float, default=0.0, help="Deadline in seconds for each pass (0 = none)")
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run's output lengths as the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.0, help="Allowed relative change in output length")
+    parser.add_argument("--min-rate", type=float, default=0.0, help="Fail when the cold pipeline pass extracts fewer articles/s")
+    parser.add_argument("--show", type=int, default=10, help="Parity mismatches to print")
+    parser.add_argument("--json", help="Also write the results to this JSON file")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    dag_module = load_dag_module()
+    # The engine logs every page at INFO
+    logging.getLogger().setLevel(logging.WARNING)
+    sources = {source["name"]: source for source in dag_module.DEFAULT_SOURCES}
+    store = FixtureStore(args.fixtures)
+    if args.record:
+        enabled = [source for source in sources.values() if source.get("enabled", True)]
+        headers = {"User-Agent": dag_module.HTTP_USER_AGENT, "Accept-Encoding": dag_module.HTTP_ACCEPT_ENCODING}
+        print(f"📥 Recorded {record_sources(store, enabled, headers, args.max_entries)} new responses into {args.fixtures}")
+
+    pages = []
+    for url in store.urls("page"):
+        entry, body = store.get(url)
+        source = entry.get("source", "")
+        pages.append({
+            "url": url,
+            "source": source,
+            "body": body,
+            "encoding": requests.utils.get_encoding_from_headers({"content-type": entry["content_type"]}),
+            "strategies": source_strategies(dag_module, sources, source),
+        })
+    if not pages:
+        print(f"❌ No recorded pages in {args.fixtures} (run with --record first)")
+        return 1
+    print(f"📊 {len(pages)} pages, {sum(len(page['body']) for page in pages) / 1e6:.1f} MB, "
+          f"backend {dag_module.HTML_EXTRACTION_BACKEND}")
+
+    args.workers = max(1, args.workers)
+    # Fork the parsing processes before the replay server's threads exist
+    cpu_pool = dag_module.ExtractionProcessPool(max(0, args.processes))
+    cpu_pool.start()
+    try:
+        with ReplayServer(store, latency=args.latency_ms / 1000) as server, \
+                tempfile.TemporaryDirectory(prefix="bench_extraction_") as state_dir:
+            transport = ReplayTransport(server, dag_module.HttpTransport(pool_maxsize=args.workers))
+            print(f"  transport: {transport.describe()}")
+            try:
+                articles = replay_feeds(dag_module, store, sources, transport, state_dir)
+                passes = run_pipeline(dag_module, articles, sources, transport, cpu_pool, state_dir, args)
+            finally:
+                transport.close()
+    finally:
+        cpu_pool.close()
+    for result in passes:
+        print(f"  pipeline, {result['pass']:>11}: {result['articles_per_second']:7.1f} articles/s "
+              f"({result['extracted']}/{sum(len(items) for items in articles.values())} extracted, "
+              f"skipped {result['skipped'] or 'none'}, cache {result['cache']})")
+    print(f"  ({args.workers} threads, {cpu_pool.processes} processes, {args.latency_ms:g} ms latency)")
+    failed = False
+    if passes[0]["articles_per_second"] < args.min_rate:
+        print(f"❌ Pipeline ran at {passes[0]['articles_per_second']:.1f} articles/s, below --min-rate {args.min_rate:g}")
+        failed = True
+
+    timings, chars = run_strategies(dag_module, pages)
+    report = {"pages": len(pages), "pipeline_articles_per_second": passes[0]["articles_per_second"],
+              "pipeline": passes, "strategies": {}}
+    for name, samples in timings.items():
+        if not samples:
+            continue
+        latencies = [s for s, _ in samples]
+        successes = sum(1 for _, length in samples if length)
+        report["strategies"][name] = stats = {
+            "pages": len(samples),
+            "success_rate": successes / len(samples),
+            "median_ms": statistics.median(latencies) * 1000,
+            "p95_ms": percentile(latencies, 0.95) * 1000,
+            "pages_per_second": len(samples) / sum(latencies) if sum(latencies) else 0.0,
+        }
+        print(f"  {name:>13} | {stats['pages']:4} pages | success {stats['success_rate']:6.1%} | "
+              f"median {stats['median_ms']:7.1f} ms | p95 {stats['p95_ms']:7.1f} ms | {stats['pages_per_second']:7.1f} pages/s")
+
+    # ru_maxrss is in KiB on Linux
+    report["peak_rss_mb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    report["peak_worker_rss_mb"] = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024
+    print(f"  peak RSS {report['peak_rss_mb']:.0f} MB, worker processes {report['peak_worker_rss_mb']:.0f} MB")
+
+    baseline_path = os.path.join(args.fixtures, "baseline.json")
+    if args.save_baseline:
+        with open(baseline_path, "w", encoding="utf-8") as f:
+            json.dump(chars, f, indent=2)
+        print(f"💾 Baseline of {len(chars)} pages saved to {baseline_path}")
+    elif os.path.exists(baseline_path):
+        with open(baseline_path, "r", encoding="utf-8") as f:
+            mismatches = compare(json.load(f), chars, args.tolerance)
+        report["parity_mismatches"] = len(mismatches)
+        for url, name, expected, length in mismatches[:args.show]:
+            print(f"    {name} {url}: {expected} -> {length} chars")
+        if mismatches:
+            print(f"❌ {len(mismatches)} outputs changed length beyond {args.tolerance:.0%}")
+            failed = True
+        else:
+            print("✅ Output lengths match the baseline")
+    else:
+        print(f"⚠️  No baseline at {baseline_path}; run with --save-baseline to create one")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Benchmark - selector-based HTML extraction
+Runs the BeautifulSoup and lxml backends of the generic and TechCrunch extractors over stored
+article pages, checks that they return the same text and reports pages per second for each.
+Parity is reported on the raw extractor output and after clean_extracted_text, which is what the
+pipeline stores (libxml2 normalizes CRLF line endings, so raw text can differ in whitespace only).
+
+Pages are stored once with --record (downloaded from the links in the article archive)
+so later runs are repeatable and offline. Run inside the Airflow image, e.g.:
+    docker compose run --rm airflow-cli python /opt/airflow/benchmarks/bench_html_extraction.py --record
+    docker compose run --rm airflow-cli python /opt/airflow/benchmarks/bench_html_extraction.py
+"""
+
+import argparse
+import glob
+import hashlib
+import os
+import sys
+import time
+
+import requests
+
+from _dag_module import DEFAULT_ARTICLES_ARCHIVE, load_dag_module, load_saved_articles
+
+DEFAULT_HTML_DIR = "/opt/airflow/logs/html_corpus"
+
+
+def record_pages(articles_glob: str, html_dir: str) -> int:
+    """Download every saved article link that is not in the corpus yet."""
+    os.makedirs(html_dir, exist_ok=True)
+    session = requests.Session()
+    session.headers["User-Agent"] = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    recorded = 0
+    for article in load_saved_articles(articles_glob):
+        link = article.get("link")
+        if not link:
+            continue
+        path = os.path.join(html_dir, hashlib.sha1(link.encode()).hexdigest()[:16] + ".html")
+        if os.path.exists(path):
+            continue
+        try:
+            response = session.get(link, timeout=30)
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            print(f"⚠️  {link}: {e}")
+            continue
+        with open(path, "wb") as f:
+            f.write(response.content)
+        recorded += 1
+    return recorded
+
+
+def first_difference(a: str, b: str) -> str:
+    if a is None or b is None:
+        return f"bs4={'None' if a is None else f'{len(a)} chars'} lxml={'None' if b is None else f'{len(b)} chars'}"
+    offset = next((i for i, (x, y) in enumerate(zip(a, b)) if x != y), min(len(a), len(b)))
+    return f"at char {offset}: bs4={a[max(0, offset - 40):offset + 40]!r} lxml={b[max(0, offset - 40):offset + 40]!r}"
+
+
+def bench(fn, pages: list, repeat: int) -> tuple:
+    outputs = [fn(html) for html in pages]
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for html in pages:
+            fn(html)
+    return outputs, (time.perf_counter() - started) / repeat
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare the bs4 and lxml HTML extraction backends")
+    parser.add_argument("--html-dir", default=DEFAULT_HTML_DIR, help="Directory of stored .html pages")
+    parser.add_argument("--record", action="store_true", help="Download pages linked from saved articles first")
+    parser.add_argument("--articles", default=DEFAULT_ARTICLES_ARCHIVE, help="Article archive directory (or a glob of legacy articles_*.json files)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed passes over the corpus")
+    parser.add_argument("--show", type=int, default=5, help="Mismatches to print per extractor")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    if args.record:
+        print(f"📥 Recorded {record_pages(args.articles, args.html_dir)} new pages into {args.html_dir}")
+
+    paths = sorted(glob.glob(os.path.join(args.html_dir, "*.html")))
+    if not paths:
+        print(f"❌ No stored pages in {args.html_dir} (run with --record first)")
+        return 1
+    names = [os.path.basename(path) for path in paths]
+    pages = []
+    for path in paths:
+        with open(path, "rb") as f:
+            pages.append(f.read().decode("utf-8", errors="replace"))
+
+    dag_module = load_dag_module()
+    print(f"📊 {len(pages)} pages, {sum(len(page) for page in pages) / 1e6:.1f}M chars")
+    failures = 0
+    for label, index in (("article", 0), ("techcrunch", 1)):
+        bs4_out, bs4_s = bench(dag_module.HTML_BACKENDS["bs4"][index], pages, args.repeat)
+        lxml_out, lxml_s = bench(dag_module.HTML_BACKENDS["lxml"][index], pages, args.repeat)
+        mismatches = [i for i, (a, b) in enumerate(zip(bs4_out, lxml_out)) if a != b]
+        cleaned_mismatches = [i for i in mismatches
+                              if dag_module.clean_extracted_text(bs4_out[i], "") != dag_module.clean_extracted_text(lxml_out[i], "")]
+        failures += len(cleaned_mismatches)
+        print(f"{label:>10} | bs4 {len(pages) / bs4_s:7.1f} pages/s | lxml {len(pages) / lxml_s:7.1f} pages/s | "
+              f"{bs4_s / lxml_s:5.1f}x | raw mismatches {len(mismatches)}/{len(pages)} | "
+              f"after cleaning {len(cleaned_mismatches)}/{len(pages)}")
+        for i in mismatches[:args.show]:
+            print(f"    {names[i]} {first_difference(bs4_out[i], lxml_out[i])}")
+
+    if failures:
+        print(f"⚠️  {failures} cleaned extractions differ between backends")
+        return 1
+    print("✅ Both backends produce identical article text")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,10 @@
+"""Test setup: the DAG file is imported as the ``tech_news_publisher`` module.
+
+Run from airflow-dags/ with Airflow and the extraction libraries installed:
+    AIRFLOW_HOME=/tmp/airflow TECH_NEWS_STATE_DIR=/tmp/state python -m pytest tests
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "dags"))
@@ -0,0 +1,95 @@
+"""BackendOutbox: idempotent queuing, newest-wins delivery, supersede on success and retry backoff."""
+
+import json
+import time
+
+import pytest
+
+import tech_news_publisher
+from tech_news_publisher import BackendOutbox
+
+
+class FakeResponse:
+    def __init__(self, status_code, text=""):
+        self.status_code = status_code
+        self.text = text
+
+
+@pytest.fixture
+def outbox(tmp_path):
+    box = BackendOutbox(path=str(tmp_path / "outbox.sqlite"))
+    box.sent = []
+    box.responses = []
+
+    def post(backend_url, secret, kind, key, payload):
+        box.sent.append(json.loads(payload)["summary"])
+        return box.responses.pop(0) if box.responses else FakeResponse(200)
+
+    box._post = post
+    yield box
+    box.close()
+
+
+def queue(outbox, summary, run_id):
+    key = BackendOutbox.idempotency_key("summary", run_id, summary)
+    return outbox.enqueue("summary", {"summary": summary}, key)
+
+
+def statuses(outbox):
+    return dict(outbox.conn.execute("SELECT json_extract(payload, '$.summary'), status FROM outbox"))
+
+
+def test_same_payload_is_queued_once(outbox):
+    assert queue(outbox, "briefing", "run-1")
+    assert not queue(outbox, "briefing", "run-1")
+    assert outbox.pending() == 1
+
+
+def test_newest_summary_is_sent_and_supersedes_older_ones(outbox):
+    queue(outbox, "monday", "run-1")
+    queue(outbox, "tuesday", "run-2")
+    outcome = outbox.deliver("http://backend", "secret")
+    assert outbox.sent == ["tuesday"]
+    assert outcome["delivered"] == 1 and outcome["superseded"] == 1
+    assert statuses(outbox) == {"monday": "superseded", "tuesday": "delivered"}
+    assert outbox.next_attempt_at() is None
+
+
+def test_rejected_summary_makes_way_for_the_previous_one(outbox):
+    queue(outbox, "monday", "run-1")
+    queue(outbox, "tuesday", "run-2")
+    outbox.responses = [FakeResponse(422, "bad payload")]
+    assert outbox.deliver("http://backend", "secret")["rejected"] == 1
+    assert statuses(outbox) == {"monday": "pending", "tuesday": "rejected"}
+
+    outbox.deliver("http://backend", "secret")
+    assert outbox.sent == ["tuesday", "monday"]
+    assert statuses(outbox)["monday"] == "delivered"
+
+
+def test_failed_delivery_is_retried_after_a_backoff(outbox):
+    queue(outbox, "monday", "run-1")
+    outbox.responses = [FakeResponse(503)]
+    before = time.time()
+    assert outbox.deliver("http://backend", "secret")["retried"] == 1
+    assert outbox.next_attempt_at() >= before + tech_news_publisher.BACKEND_RETRY_BASE_SECONDS * 0.5
+    # Not due yet: nothing is sent until the backoff has passed
+    assert outbox.deliver("http://backend", "secret")["delivered"] == 0
+    assert outbox.sent == ["monday"]
+
+
+def test_newer_summary_is_not_held_back_by_an_older_retry(outbox):
+    queue(outbox, "monday", "run-1")
+    outbox.responses = [FakeResponse(503)]
+    outbox.deliver("http://backend", "secret")
+    queue(outbox, "tuesday", "run-2")
+    outbox.deliver("http://backend", "secret")
+    assert outbox.sent == ["monday", "tuesday"]
+    assert statuses(outbox) == {"monday": "superseded", "tuesday": "delivered"}
+
+
+def test_backoff_grows_exponentially_up_to_the_cap():
+    base, cap = tech_news_publisher.BACKEND_RETRY_BASE_SECONDS, tech_news_publisher.BACKEND_RETRY_MAX_SECONDS
+    for attempts in range(1, 12):
+        delay = min(cap, base * 2 ** (attempts - 1))
+        assert delay * 0.5 <= BackendOutbox.backoff(attempts) <= delay
@@ -0,0 +1,73 @@
+"""CircuitBreaker: trips after consecutive failures and probes with one page in a later run."""
+
+import pytest
+
+from tech_news_publisher import CircuitBreaker
+
+DOMAIN = "techcrunch.com"
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "circuit_breakers.json")
+
+
+def tripped(path, run_id="run-1"):
+    breaker = CircuitBreaker(run_id=run_id, path=path, failures=3, slow_seconds=10)
+    for _ in range(3):
+        assert breaker.allow(DOMAIN)
+        breaker.record(DOMAIN, False, 1.0)
+    return breaker
+
+
+def test_consecutive_failures_open_the_breaker_for_the_run(path):
+    breaker = tripped(path)
+    assert breaker.state(DOMAIN) == "open"
+    assert not breaker.allow(DOMAIN, timeout=0)
+
+
+def test_success_resets_the_failure_count(path):
+    breaker = CircuitBreaker(run_id="run-1", path=path, failures=3, slow_seconds=10)
+    for success in (False, False, True, False, False):
+        breaker.record(DOMAIN, success, 1.0)
+    assert breaker.state(DOMAIN) == "closed"
+
+
+def test_slow_page_counts_as_a_failure(path):
+    breaker = CircuitBreaker(run_id="run-1", path=path, failures=1, slow_seconds=10)
+    breaker.record(DOMAIN, True, 30.0)
+    assert breaker.state(DOMAIN) == "open"
+
+
+def test_later_run_sends_one_probe_while_the_others_wait(path):
+    tripped(path)
+    breaker = CircuitBreaker(run_id="run-2", path=path, failures=3, slow_seconds=10)
+    assert breaker.state(DOMAIN) == "half_open"
+    assert breaker.allow(DOMAIN)
+    assert not breaker.allow(DOMAIN, timeout=0)
+
+
+def test_successful_probe_closes_the_breaker(path):
+    tripped(path)
+    breaker = CircuitBreaker(run_id="run-2", path=path, failures=3, slow_seconds=10)
+    assert breaker.allow(DOMAIN)
+    breaker.record(DOMAIN, True, 1.0)
+    assert breaker.state(DOMAIN) == "closed"
+    assert breaker.allow(DOMAIN, timeout=0)
+
+
+def test_failed_probe_opens_the_breaker_again_at_once(path):
+    tripped(path)
+    breaker = CircuitBreaker(run_id="run-2", path=path, failures=3, slow_seconds=10)
+    assert breaker.allow(DOMAIN)
+    breaker.record(DOMAIN, False, 1.0)
+    assert breaker.state(DOMAIN) == "open"
+    assert CircuitBreaker(run_id="run-2", path=path).state(DOMAIN) == "open"
+
+
+def test_released_probe_lets_another_page_probe(path):
+    tripped(path)
+    breaker = CircuitBreaker(run_id="run-2", path=path, failures=3, slow_seconds=10)
+    assert breaker.allow(DOMAIN)
+    breaker.release(DOMAIN)
+    assert breaker.allow(DOMAIN, timeout=0)
@@ -0,0 +1,88 @@
+"""Precompiled cleaning rules must give exactly what applying every pattern in sequence gave."""
+
+import re
+
+import pytest
+
+from tech_news_publisher import clean_article_text, clean_extracted_text
+
+BOILERPLATE = [
+    r"Subscribe to.*?newsletter", r"Follow us on.*?social media", r"Share this article",
+    r"Read more(?:\s+articles)?:?", r"Continue reading", r"Sign up for.*?updates", r"Get the latest.*?news",
+    r"This article originally appeared on.*?\.com", r"Image credit:.*", r"Photo credit:.*", r"Source:.*",
+    r"Related:.*", r"See also:.*", r"Advertisement", r"ADVERTISEMENT", r"Sponsored content",
+    r"\d+ comments?", r"Comments? \(\d+\)",
+]
+SOURCE_PATTERNS = {
+    "TechCrunch": [(r"We're launching.*?TC Sessions.*?\.(?:\s|$)", re.IGNORECASE),
+                   (r"Image Credits?:.*?(?:\.|$)", re.IGNORECASE)],
+    "Engadget": [(r"This article originally appeared on Engadget.*", re.DOTALL),
+                 (r"Image credit:.*?Engadget", re.IGNORECASE)],
+    "Gizmodo": [(r"Image:.*?Gizmodo", re.IGNORECASE), (r"Read more:.*", re.DOTALL)],
+    "The Information": [(r"This story is available exclusively to.*", re.IGNORECASE),
+                        (r"Subscribe to.*?The Information.*", re.IGNORECASE)],
+}
+CALLS_TO_ACTION = [
+    "Subscribe to our newsletter", "Sign up for our newsletter", "Follow us on",
+    "If you buy something through a link in this article, we may earn commission",
+    "Why you can trust us Engadget has been testing and reviewing consumer tech since 2004",
+    "Our stories may include affiliate links; if you buy something through a link, we may earn a commission",
+    "about how we evaluate products",
+]
+
+
+def reference_clean_extracted_text(text, source):
+    if not text:
+        return ""
+    for pattern in BOILERPLATE:
+        text = re.sub(pattern, "", text, flags=re.IGNORECASE | re.DOTALL)
+    for name, patterns in SOURCE_PATTERNS.items():
+        if name in source:
+            for pattern, flags in patterns:
+                text = re.sub(pattern, "", text, flags=flags)
+            break
+    text = re.sub(r'\s+', ' ', text.strip())
+    return text.strip()
+
+
+def reference_clean_article_text(content):
+    content = re.sub(r'This article originally appeared on.*?\.', '', content, flags=re.IGNORECASE)
+    content = re.sub(r'About our ads.*$', '', content, flags=re.IGNORECASE | re.DOTALL)
+    content = re.sub(r'\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s*$', '', content)
+    content = re.sub(r'<[^>]+>', '', content)
+    content = re.sub(r'\s+', ' ', content).strip()
+    for phrase in CALLS_TO_ACTION:
+        content = re.sub(re.escape(phrase) + r'.*?\.', '', content, flags=re.IGNORECASE)
+    return content
+
+
+SAMPLES = [
+    "",
+    "A plain paragraph with nothing to remove.",
+    "Startup raises $40M.\n\nSUBSCRIBE TO our daily NEWSLETTER for more.  Share this article 12 comments",
+    "The chip ships in May. Image Credits: Apple. We're launching TC Sessions: AI next month. More text",
+    "Review of the phone. Image credit: Jane Doe / Engadget This article originally appeared on Engadget at x",
+    "Deal of the day. Image: Gizmodo staff Gizmodo Read more: the rest of the page",
+    "Paywalled intro. This story is available exclusively to subscribers. Subscribe to The Information now",
+    "Read more articles: none. Comments (42) Continue reading Advertisement ADVERTISEMENT Sponsored content",
+    "Get the latest tech news daily. Sign up for weekly updates. Follow us on all social media. Ok.",
+    "Body text. Related: other story\nSee also: another\nSource: Reuters",
+    "Prices in straße und STRASSE. Ünïcödé Read More: end",
+    "Story text ends here. If you buy something through a link in this article, we may earn commission. Bye",
+    "Nice laptop <b>review</b>. About our ads and more footer. Follow us on X.",
+    "Intro. Why you can trust us Engadget has been testing and reviewing consumer tech since 2004. Verdict",
+    "The launch went well. This article originally appeared on Wired.com. Written by Jane Smith",
+    "All caps ending NASA Launches New Rocket",
+]
+SOURCES = ["TechCrunch", "Engadget", "Gizmodo", "The Information", "Wired"]
+
+
+@pytest.mark.parametrize("source", SOURCES)
+@pytest.mark.parametrize("text", SAMPLES)
+def test_clean_extracted_text_matches_sequential_patterns(text, source):
+    assert clean_extracted_text(text, source) == reference_clean_extracted_text(text, source)
+
+
+@pytest.mark.parametrize("text", SAMPLES)
+def test_clean_article_text_matches_sequential_patterns(text):
+    assert clean_article_text(text) == reference_clean_article_text(text)
@@ -0,0 +1,99 @@
+"""FeedPoller: conditional polls and diffing of entries against the last committed poll."""
+
+import pytest
+
+from tech_news_publisher import FeedPoller
+
+FEED_URL = "https://example.com/feed"
+
+
+def rss(*guids):
+    items = "".join(
+        f"<item><title>Story {guid}</title><link>https://example.com/{guid}</link><guid>{guid}</guid></item>"
+        for guid in guids
+    )
+    return f'<?xml version="1.0"?><rss version="2.0"><channel><title>Example</title>{items}</channel></rss>'.encode()
+
+
+class FakeResponse:
+    def __init__(self, status_code, content=b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+        self.url = FEED_URL
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeTransport:
+    """Serves a fixed feed, answering 304 when the client sends its ETag back."""
+
+    def __init__(self, content, etag):
+        self.content, self.etag = content, etag
+        self.requests = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.requests.append(dict(headers or {}))
+        if self.etag and (headers or {}).get("If-None-Match") == self.etag:
+            return FakeResponse(304)
+        return FakeResponse(200, self.content, {"ETag": self.etag} if self.etag else {})
+
+
+@pytest.fixture
+def state_path(tmp_path):
+    return str(tmp_path / "feed_state.sqlite")
+
+
+def new_stories(result):
+    return [entry.title for entry in result.new_entries]
+
+
+def poll(state_path, transport, commit=True):
+    poller = FeedPoller(path=state_path, transport=transport)
+    try:
+        result = poller.poll(FEED_URL)
+        if commit:
+            poller.commit(result)
+        return result
+    finally:
+        poller.close()
+
+
+def test_first_poll_offers_every_entry(state_path):
+    result = poll(state_path, FakeTransport(rss("a", "b"), '"v1"'))
+    assert new_stories(result) == ["Story a", "Story b"]
+
+
+def test_unchanged_feed_is_not_modified(state_path):
+    poll(state_path, FakeTransport(rss("a", "b"), '"v1"'))
+    transport = FakeTransport(rss("a", "b"), '"v1"')
+    result = poll(state_path, transport)
+    assert transport.requests[0]["If-None-Match"] == '"v1"'
+    assert result.not_modified and result.new_entries == []
+
+
+def test_only_entries_missing_from_the_last_poll_are_new(state_path):
+    poll(state_path, FakeTransport(rss("a", "b"), '"v1"'))
+    result = poll(state_path, FakeTransport(rss("c", "a", "b"), '"v2"'))
+    assert new_stories(result) == ["Story c"]
+
+
+def test_uncommitted_poll_offers_its_entries_again(state_path):
+    poll(state_path, FakeTransport(rss("a"), '"v1"'))
+    poll(state_path, FakeTransport(rss("b", "a"), '"v2"'), commit=False)
+    result = poll(state_path, FakeTransport(rss("b", "a"), '"v2"'))
+    assert new_stories(result) == ["Story b"]
+
+
+def test_withheld_entries_come_back_on_the_next_poll(state_path):
+    poller = FeedPoller(path=state_path, transport=FakeTransport(rss("a", "b"), '"v1"'))
+    result = poller.poll(FEED_URL)
+    assert result.withhold({FeedPoller.entry_id(result.entries[1])}) == 1
+    poller.commit(result)
+    poller.close()
+
+    transport = FakeTransport(rss("a", "b"), '"v1"')
+    result = poll(state_path, transport)
+    assert "If-None-Match" not in transport.requests[0]
+    assert new_stories(result) == ["Story b"]
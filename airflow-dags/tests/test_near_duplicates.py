@@ -0,0 +1,38 @@
+"""NearDuplicateDetector: the same story from two sources clusters, different stories do not."""
+
+from tech_news_publisher import NearDuplicateDetector
+
+STORY = (
+    "Apple announced on Tuesday that its new M5 chip will ship in the MacBook Pro later this year, "
+    "promising a forty percent jump in graphics performance and longer battery life. The company said "
+    "the chip is built on a second generation three nanometer process and adds a faster neural engine "
+    "for on device machine learning workloads, which developers can reach through the Core ML framework."
+)
+OTHER = (
+    "Nvidia reported record quarterly revenue driven by demand for data center accelerators, and the "
+    "company raised its forecast for the coming quarter. Chief executive Jensen Huang told analysts that "
+    "supply of the Blackwell platform would improve through the year as new packaging capacity comes online."
+)
+
+
+def test_reworded_copy_clusters_with_the_original():
+    copy = "Update: " + STORY.replace("on Tuesday", "today") + " Shares rose slightly."
+    clusters = NearDuplicateDetector().cluster([STORY, OTHER, copy])
+    assert sorted(map(sorted, clusters)) == [[0, 2], [1]]
+
+
+def test_distinct_stories_stay_apart():
+    clusters = NearDuplicateDetector().cluster([STORY, OTHER])
+    assert sorted(map(sorted, clusters)) == [[0], [1]]
+
+
+def test_short_and_empty_texts_are_singletons():
+    clusters = NearDuplicateDetector().cluster(["", "Apple", STORY])
+    assert sorted(map(sorted, clusters)) == [[0], [1], [2]]
+
+
+def test_similarity_of_identical_signatures_is_one():
+    detector = NearDuplicateDetector()
+    signature = detector.signature(STORY)
+    assert detector.similarity(signature, signature) == 1.0
+    assert detector.similarity(signature, detector.signature(OTHER)) < detector.threshold
@@ -0,0 +1,61 @@
+"""PromptPacker: per-source water-filling that must never exceed its token budget."""
+
+from tech_news_publisher import PromptPacker
+
+
+def article(source, n, words=200):
+    body = " ".join(f"Sentence {i} of story {n} from {source} has several words." for i in range(words // 8))
+    return {"source": source, "title": f"{source} story {n}", "content": body}
+
+
+def test_articles_within_budget_are_kept_whole():
+    articles = [article("TechCrunch", 1, 40), article("Engadget", 1, 40)]
+    packed, stats = PromptPacker(10_000).pack(articles)
+    assert packed == articles
+    assert stats["trimmed_articles"] == 0
+    assert stats["tokens_after"] == stats["tokens_before"]
+
+
+def test_pack_stays_within_budget_when_titles_crowd_it():
+    articles = [article(source, n) for n in range(20) for source in ("TechCrunch", "Engadget", "Wired")]
+    packer = PromptPacker(2000)
+    packed, stats = packer.pack(articles)
+    assert 0 < stats["tokens_after"] <= 2000
+    assert sum(packer.article_tokens(a) for a in packed) == stats["tokens_after"]
+    assert stats["dropped_articles"] == len(articles) - len(packed) > 0
+
+
+def test_every_source_keeps_its_first_articles_before_later_ones():
+    articles = [article("TechCrunch", n) for n in range(30)] + [article("Engadget", 0)]
+    packed, _ = PromptPacker(400).pack(articles)
+    titles = [a["title"] for a in packed]
+    assert "Engadget story 0" in titles
+    assert "TechCrunch story 0" in titles
+    assert "TechCrunch story 29" not in titles
+
+
+def test_short_articles_donate_their_share_to_long_ones():
+    short, long = article("TechCrunch", 1, 16), article("TechCrunch", 2, 2000)
+    packer = PromptPacker(1200)
+    packed, stats = packer.pack([short, long])
+    assert packed[0] == short
+    assert packed[1]["content"] != long["content"]
+    assert stats["trimmed_articles"] == 1
+    assert stats["tokens_after"] <= 1200
+
+
+def test_lead_text_keeps_whole_sentences():
+    text = "First sentence here. Second one follows. Third is last."
+    assert PromptPacker.lead_text(text, 11) == "First sentence here. Second one follows."
+
+
+def test_lead_text_hard_cut_fits_with_its_ellipsis():
+    text = "word " * 100
+    cut = PromptPacker.lead_text(text, 5)
+    assert cut.endswith("…")
+    assert len(cut) <= 5 * PromptPacker.CHARS_PER_TOKEN
+
+
+def test_water_fill_caps_small_demands_and_shares_the_rest():
+    allocation = PromptPacker.water_fill({"a": 10, "b": 100, "c": 100}, 110)
+    assert allocation == {"a": 10, "b": 50, "c": 50}